@@ -43,7 +43,9 @@ special_days = [
     "beer_capital",
     "music_fest",
 ]
-data[special_days] = data[special_days].apply(lambda x: x.map({0: "", 1: x.name})).astype("category")
+# special days are 0/1 flags - use them directly as category codes instead of mapping to strings first
+for name in special_days:
+    data[name] = pd.Categorical.from_codes(data[name], categories=["", name])
 
 training_cutoff = data["time_idx"].max() - 6
 max_encoder_length = 36
@@ -293,8 +293,68 @@ class NaNLabelEncoder(InitialParameterRepresenterMixIn, BaseEstimator, Transform
                 idx += 1
 
         self.classes_vector_ = np.array(list(self.classes_.keys()))
+        self._set_sorted_classes()
         return self
 
+    def _set_sorted_classes(self):
+        """
+        Sort classes to allow vectorized lookups with binary search in :py:meth:`~transform`.
+
+        Only classes that are all numeric or all strings are sorted - lookups fall back to dictionary access otherwise.
+        """
+        classes = np.array(list(self.classes_.keys()))
+        if classes.dtype.kind in "biuf" or (
+            classes.dtype.kind == "U" and all(isinstance(c, str) for c in self.classes_.keys())
+        ):
+            order = np.argsort(classes, kind="stable")
+            self.sorted_classes_ = classes[order]
+            self.sorted_codes_ = np.array(list(self.classes_.values()), dtype=np.int64)[order]
+        else:
+            self.sorted_classes_ = None
+
+    def _lookup(self, y: Iterable) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Look up codes of values.
+
+        Args:
+            y (Iterable): values to look up
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: tuple of codes (undefined for unknown values) and mask of known values
+        """
+        if isinstance(y, pd.Series) and isinstance(y.dtype, pd.CategoricalDtype):
+            # look up categories only and select them with the category codes (-1 for NaN selects the appended unknown)
+            category_codes, category_known = self._lookup(y.cat.categories)
+            positions = y.cat.codes.to_numpy()
+            return np.append(category_codes, 0)[positions], np.append(category_known, False)[positions]
+
+        if not hasattr(self, "sorted_classes_"):  # encoder fitted with previous version
+            self._set_sorted_classes()
+        if self.sorted_classes_ is not None and len(self.sorted_classes_) > 0:
+            if isinstance(y, torch.Tensor):
+                values = y.cpu().numpy()
+            else:
+                values = np.asarray(y)
+            # only compare values of the same kind as the classes
+            if self.sorted_classes_.dtype.kind == "U":
+                if pd.api.types.infer_dtype(values, skipna=False) == "string":
+                    values = values.astype(str)
+                else:
+                    values = None
+            elif values.dtype.kind not in "biuf":
+                values = None
+            if values is not None:
+                positions = np.searchsorted(self.sorted_classes_, values).clip(max=len(self.sorted_classes_) - 1)
+                return self.sorted_codes_[positions], self.sorted_classes_[positions] == values
+
+        # hash-based lookup for classes that cannot be sorted, e.g. mixed types
+        if isinstance(y, torch.Tensor):
+            y = y.cpu().numpy()
+        positions = pd.Index(list(self.classes_.keys()), dtype=object).get_indexer(pd.Index(list(y), dtype=object))
+        known = positions >= 0
+        codes = np.append(np.array(list(self.classes_.values()), dtype=np.int64), 0)[positions]
+        return codes, known
+
     def transform(
         self, y: Iterable, return_norm: bool = False, target_scale=None, ignore_na: bool = False
     ) -> Union[torch.Tensor, np.ndarray]:
@@ -312,33 +372,31 @@ class NaNLabelEncoder(InitialParameterRepresenterMixIn, BaseEstimator, Transform
         Returns:
             Union[torch.Tensor, np.ndarray]: returns encoded data as torch tensor or numpy array depending on input type
         """
+        codes, known = self._lookup(y)
         if self.add_nan:
-            if self.warn:
-                cond = np.array([item not in self.classes_ for item in y])
-                if cond.any():
-                    warnings.warn(
-                        f"Found {np.unique(np.asarray(y)[cond]).size} unknown classes which were set to NaN",
-                        UserWarning,
-                    )
-
-            encoded = [self.classes_.get(v, 0) for v in y]
+            if self.warn and not known.all():
+                warnings.warn(
+                    f"Found {np.unique(np.asarray(y)[~known]).size} unknown classes which were set to NaN",
+                    UserWarning,
+                )
+            encoded = np.where(known, codes, 0)
 
         else:
             if ignore_na:
                 na_fill_value = next(iter(self.classes_.values()))
-                encoded = [self.classes_.get(v, na_fill_value) for v in y]
+                encoded = np.where(known, codes, na_fill_value)
             else:
-                try:
-                    encoded = [self.classes_[v] for v in y]
-                except KeyError as e:
+                if not known.all():
                     raise KeyError(
-                        f"Unknown category '{e.args[0]}' encountered. Set `add_nan=True` to allow unknown categories"
+                        f"Unknown category '{np.asarray(y)[~known][0]}' encountered. "
+                        "Set `add_nan=True` to allow unknown categories"
                     )
+                encoded = codes
 
         if isinstance(y, torch.Tensor):
             encoded = torch.tensor(encoded, dtype=torch.long, device=y.device)
         else:
-            encoded = np.array(encoded)
+            encoded = np.asarray(encoded, dtype=np.int64)
 
         if return_norm:
             return encoded, self.get_parameters()
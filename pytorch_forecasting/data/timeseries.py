@@ -30,15 +30,19 @@ from pytorch_forecasting.data.encoders import (
     TorchNormalizer,
 )
 from pytorch_forecasting.data.samplers import TimeSynchronizedBatchSampler
-from pytorch_forecasting.utils import repr_class
+from pytorch_forecasting.utils import repr_class, to_list
 
 
 def _find_end_indices(diffs: np.ndarray, max_lengths: np.ndarray, min_length: int) -> Tuple[np.ndarray, np.ndarray]:
     """
     Identify end indices in series even if some values are missing.
 
+    The search is fully vectorized: the time elapsed between two positions is the difference of the cumulative
+    sum of ``diffs``, so the end of each sequence can be looked up with a binary search.
+
     Args:
-        diffs (np.ndarray): array of differences to next time step. nans should be filled up with ones
+        diffs (np.ndarray): array of differences to next time step. nans should be filled up with ones.
+            Differences have to be strictly positive, i.e. time steps must be unique within a series.
         max_lengths (np.ndarray): maximum length of sequence by position.
         min_length (int): minimum length of sequence.
 
@@ -46,39 +50,39 @@ def _find_end_indices(diffs: np.ndarray, max_lengths: np.ndarray, min_length: in
         Tuple[np.ndarray, np.ndarray]: tuple of arrays where first is end indices and second is list of start
             and end indices that are currently missing.
     """
-    missing_start_ends = []
-    end_indices = []
-    length = 1
-    start_idx = 0
-    max_idx = len(diffs) - 1
-    max_length = max_lengths[start_idx]
-
-    for idx, diff in enumerate(diffs):
-        if length >= max_length:
-            while length >= max_length:
-                if length == max_length:
-                    end_indices.append(idx)
-                else:
-                    end_indices.append(idx - 1)
-                length -= diffs[start_idx]
-                if start_idx < max_idx:
-                    start_idx += 1
-                max_length = max_lengths[start_idx]
-        elif length >= min_length:
-            missing_start_ends.append([start_idx, idx])
-        length += diff
-    if len(missing_start_ends) > 0:  # required for numba compliance
-        return np.asarray(end_indices), np.asarray(missing_start_ends)
-    else:
-        return np.asarray(end_indices), np.empty((0, 2), dtype=np.int64)
+    diffs = np.asarray(diffs, dtype=np.int64)
+    max_lengths = np.asarray(max_lengths, dtype=np.int64)
+    positions = np.arange(len(diffs))
+
+    # time elapsed since the first position - strictly increasing only if all differences are positive
+    elapsed = np.cumsum(diffs) - diffs
+    last_elapsed = elapsed + max_lengths - 1
+
+    # last position that fits into the maximum length of the sequence starting at each position
+    end_indices = np.searchsorted(elapsed, last_elapsed, side="right") - 1
+
+    # a sequence that ends on a given position but does not have the maximum length yet is "missing" if no other
+    # sequence is complete at this position and it is at least of minimum length. It starts at the first position
+    # whose sequence has not been completed yet.
+    completed = np.searchsorted(elapsed, last_elapsed, side="left")
+    start_indices = np.searchsorted(completed, positions, side="left").clip(max=len(diffs) - 1)
+    lengths = elapsed - elapsed[start_indices] + 1
+    is_missing = (completed[start_indices] != positions) & (lengths >= min_length)
+    missing_start_ends = np.stack([start_indices[is_missing], positions[is_missing]], axis=1)
+    return end_indices, missing_start_ends
 
 
-try:
-    import numba
+def _worker_init_fn(worker_id: int) -> None:
+    """
+    Seed numpy in dataloader workers.
+
+    PyTorch seeds its own random number generator differently in each worker but forked workers share the
+    numpy random state. Derive the numpy seed from the worker's PyTorch seed to avoid duplicated random streams.
 
-    _find_end_indices = numba.jit(nopython=True)(_find_end_indices)
-except ImportError:
-    pass
+    Args:
+        worker_id (int): id of worker (unused as the PyTorch seed already differs by worker)
+    """
+    np.random.seed(torch.initial_seed() % 2**32)
 
 
 def check_for_nonfinite(tensor: torch.Tensor, names: Union[str, List[str]]) -> torch.Tensor:
@@ -219,8 +223,7 @@ class TimeSeriesDataSet(Dataset):
 
         Large datasets:
 
-            Currently the class is limited to in-memory operations (that can be sped up by an
-            existing installation of `numba <https://pypi.org/project/numba/>`_). If you have extremely large data,
+            Currently the class is limited to in-memory operations. If you have extremely large data,
             however, you can pass prefitted encoders and and scalers to it and a subset of sequences to the class to
             construct a valid dataset (plus, likely the EncoderNormalizer should be used to normalize targets).
             when fitting a network, you would then to create a custom DataLoader that rotates through the datasets.
@@ -827,6 +830,7 @@ class TimeSeriesDataSet(Dataset):
                         self.scalers[name] = self.scalers[name].fit(data[[name]])
 
         # encode after fitting
+        standard_scalers = {}
         for name in self.reals:
             # targets are handled separately
             transformer = self.get_transformer(name)
@@ -835,7 +839,17 @@ class TimeSeriesDataSet(Dataset):
                 and transformer is not None
                 and not isinstance(transformer, EncoderNormalizer)
             ):
-                data[name] = self.transform_values(name, data[name], data=data, inverse=False)
+                if type(transformer) is StandardScaler:
+                    standard_scalers[name] = transformer  # scaled together below
+                else:
+                    data[name] = self.transform_values(name, data[name], data=data, inverse=False)
+
+        # scale all variables with standard scalers in one vectorized operation
+        if len(standard_scalers) > 0:
+            names = list(standard_scalers.keys())
+            center = np.array([s.mean_[0] if s.with_mean else 0.0 for s in standard_scalers.values()])
+            scale = np.array([s.scale_[0] if s.with_std else 1.0 for s in standard_scalers.values()])
+            data[names] = (data[names].to_numpy(dtype=np.float64) - center) / scale
 
         # encode lagged categorical targets
         for name in self.lagged_targets:
@@ -1115,6 +1129,103 @@ class TimeSeriesDataSet(Dataset):
             target_normalizers = [self.target_normalizer]
         return target_normalizers
 
+    @property
+    @lru_cache(None)
+    def _reals_positions(self) -> Dict[str, int]:
+        """
+        Positions of continuous variables in :py:meth:`~reals`.
+
+        Returns:
+            Dict[str, int]: dictionary mapping variable names to column positions
+        """
+        return {name: idx for idx, name in enumerate(self.reals)}
+
+    @property
+    @lru_cache(None)
+    def _flat_categoricals_positions(self) -> Dict[str, int]:
+        """
+        Positions of categorical variables in :py:meth:`~flat_categoricals`.
+
+        Returns:
+            Dict[str, int]: dictionary mapping variable names to column positions
+        """
+        return {name: idx for idx, name in enumerate(self.flat_categoricals)}
+
+    @property
+    @lru_cache(None)
+    def _dropout_categoricals_positions(self) -> List[int]:
+        """
+        Positions of :py:meth:`~dropout_categoricals` in :py:meth:`~flat_categoricals`.
+
+        Returns:
+            List[int]: list of column positions
+        """
+        return [self._flat_categoricals_positions[name] for name in self.dropout_categoricals]
+
+    @property
+    @lru_cache(None)
+    def _encoder_normalized_reals(
+        self,
+    ) -> Tuple[List[Tuple[int, EncoderNormalizer]], List[Tuple[int, EncoderNormalizer]]]:
+        """
+        Continuous covariates that are normalized by an :py:class:`~pytorch_forecasting.data.encoders.EncoderNormalizer`
+        for every sample.
+
+        Returns:
+            Tuple[List[Tuple[int, EncoderNormalizer]], List[Tuple[int, EncoderNormalizer]]]: tuple of lists of
+                column positions and normalizers where the first entry are normalizers that are fitted and the second
+                are normalizers of lagged variables that only transform.
+        """
+        covariates, lagged = [], []
+        for pos, name in enumerate(self.reals):
+            if name in self.target_names:
+                continue
+            normalizer = self.get_transformer(name)
+            if isinstance(normalizer, EncoderNormalizer):
+                if name in self.lagged_variables:
+                    lagged.append((pos, normalizer))
+                else:
+                    covariates.append((pos, normalizer))
+        return covariates, lagged
+
+    @property
+    @lru_cache(None)
+    def _constant_fill_values(self) -> Dict[str, Any]:
+        """
+        Positions and values used to fill in missing timesteps as specified by ``constant_fill_strategy``.
+
+        Returns:
+            Dict[str, Any]: dictionary with entries
+
+                * reals: tuple of column positions and values for continuous variables
+                * categoricals: tuple of column positions and values for categorical variables
+                * target: dictionary mapping target positions to values
+        """
+        target_positions = {f"__target__{name}": idx for idx, name in enumerate(self.target_names)}
+        reals, categoricals, target = {}, {}, {}
+        for name, value in self.encoded_constant_fill_strategy.items():
+            if name in self._reals_positions:
+                reals[self._reals_positions[name]] = value
+            elif name in target_positions:
+                target[target_positions[name]] = value
+            elif name in self._flat_categoricals_positions:
+                categoricals[self._flat_categoricals_positions[name]] = value
+            elif name in self.target_names:  # target is just not an input value
+                pass
+            else:
+                raise KeyError(f"Variable {name} is not known and thus cannot be filled in")
+        return dict(
+            reals=(
+                torch.tensor(list(reals.keys()), dtype=torch.long),
+                torch.tensor(list(reals.values()), dtype=torch.float),
+            ),
+            categoricals=(
+                torch.tensor(list(categoricals.keys()), dtype=torch.long),
+                torch.tensor(list(categoricals.values()), dtype=torch.long),
+            ),
+            target=target,
+        )
+
     def get_parameters(self) -> Dict[str, Any]:
         """
         Get parameters that can be used with :py:meth:`~from_parameters` to create a new dataset with the same scalers.
@@ -1215,14 +1326,32 @@ class TimeSeriesDataSet(Dataset):
         """
         g = data.groupby(self._group_ids, observed=True)
 
-        df_index_first = g["__time_idx__"].transform("nth", 0).to_frame("time_first")
-        df_index_last = g["__time_idx__"].transform("nth", -1).to_frame("time_last")
-        df_index_diff_to_next = -g["__time_idx__"].diff(-1).fillna(-1).astype(int).to_frame("time_diff_to_next")
-        df_index = pd.concat([df_index_first, df_index_last, df_index_diff_to_next], axis=1)
+        # compute first and last time index once per group and broadcast them with the group number of each row
+        # (ngroup numbers groups in the same order as the group-wise aggregations)
+        sequence_ids = g.ngroup()
+        group_positions = sequence_ids.to_numpy()
+        df_index = pd.DataFrame(
+            dict(
+                time_first=g["__time_idx__"].first().to_numpy()[group_positions],
+                time_last=g["__time_idx__"].last().to_numpy()[group_positions],
+            ),
+            index=data.index,
+        )
         df_index["index_start"] = np.arange(len(df_index))
         df_index["time"] = data["__time_idx__"]
         df_index["count"] = (df_index["time_last"] - df_index["time_first"]).astype(int) + 1
-        sequence_ids = g.ngroup()
+
+        # series with strictly increasing time steps and without gaps have as many rows as time steps between their
+        # first and last time index. In this common case, the difference to the next time step is always one and
+        # diffing can be skipped
+        sequence_sizes = np.bincount(group_positions)[group_positions]
+        within_group = group_positions[1:] == group_positions[:-1]
+        if (df_index["count"].to_numpy() == sequence_sizes).all() and (
+            np.diff(df_index["time"].to_numpy())[within_group] > 0
+        ).all():
+            df_index["time_diff_to_next"] = 1
+        else:
+            df_index["time_diff_to_next"] = -g["__time_idx__"].diff(-1).fillna(-1).astype(int)
         df_index["sequence_id"] = sequence_ids
 
         min_sequence_length = self.min_prediction_length + self.min_encoder_length
@@ -1231,8 +1360,11 @@ class TimeSeriesDataSet(Dataset):
         # calculate maximum index to include from current index_start
         max_time = (df_index["time"] + max_sequence_length - 1).clip(upper=df_index["count"] + df_index.time_first - 1)
 
+        # the end index search requires unique time steps within each series
+        assert (
+            df_index["time_diff_to_next"] > 0
+        ).all(), "Time index has to be unique within each series - found duplicate time steps"
         # if there are missing timesteps, we cannot say directly what is the last timestep to include
-        # therefore we iterate until it is found
         if (df_index["time_diff_to_next"] != 1).any():
             assert (
                 self.allow_missing_timesteps
@@ -1253,7 +1385,8 @@ class TimeSeriesDataSet(Dataset):
             df_index = pd.concat([df_index, shortened_sequences], axis=0, ignore_index=True)
 
         # filter out where encode and decode length are not satisfied
-        df_index["sequence_length"] = df_index["time"].iloc[df_index["index_end"]].to_numpy() - df_index["time"] + 1
+        time = df_index["time"].to_numpy()
+        df_index["sequence_length"] = time[df_index["index_end"].to_numpy()] - time + 1
 
         # filter too short sequences
         df_index = df_index[
@@ -1293,6 +1426,31 @@ class TimeSeriesDataSet(Dataset):
 
         return df_index
 
+    @property
+    def index(self) -> pd.DataFrame:
+        """
+        Index of samples as constructed with :py:meth:`~_construct_index`.
+
+        Returns:
+            pd.DataFrame: index dataframe with one row per subsequence
+        """
+        return self._index
+
+    @index.setter
+    def index(self, index: pd.DataFrame) -> None:
+        self._index = index
+        # accessing a row of a dataframe is slow - cache columns required by __getitem__ as numpy arrays
+        self._index_start = index["index_start"].to_numpy()
+        self._index_end = index["index_end"].to_numpy()
+        self._index_sequence_length = index["sequence_length"].to_numpy()
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        # datasets pickled before the index was cached store it as plain attribute - pass it through the setter
+        legacy_index = state.pop("index", None)
+        self.__dict__.update(state)
+        if legacy_index is not None:
+            self.index = legacy_index
+
     def filter(self, filter_func: Callable, copy: bool = True) -> "TimeSeriesDataSet":
         """
         Filter subsequences in dataset.
@@ -1476,17 +1634,18 @@ class TimeSeriesDataSet(Dataset):
         Returns:
             Tuple[Dict[str, torch.Tensor], torch.Tensor]: x and y for model
         """
-        index = self.index.iloc[idx]
+        index_start = self._index_start[idx]
+        index_end = self._index_end[idx]
         # get index data
-        data_cont = self.data["reals"][index.index_start : index.index_end + 1].clone()
-        data_cat = self.data["categoricals"][index.index_start : index.index_end + 1].clone()
-        time = self.data["time"][index.index_start : index.index_end + 1].clone()
-        target = [d[index.index_start : index.index_end + 1].clone() for d in self.data["target"]]
-        groups = self.data["groups"][index.index_start].clone()
+        data_cont = self.data["reals"][index_start : index_end + 1].clone()
+        data_cat = self.data["categoricals"][index_start : index_end + 1].clone()
+        time = self.data["time"][index_start : index_end + 1]  # read-only - no copy required
+        target = [d[index_start : index_end + 1].clone() for d in self.data["target"]]
+        groups = self.data["groups"][index_start].clone()
         if self.data["weight"] is None:
             weight = None
         else:
-            weight = self.data["weight"][index.index_start : index.index_end + 1].clone()
+            weight = self.data["weight"][index_start : index_end + 1].clone()
         # get target scale in the form of a list
         target_scale = self.target_normalizer.get_parameters(groups, self.group_ids)
         if not isinstance(self.target_normalizer, MultiNormalizer):
@@ -1494,11 +1653,14 @@ class TimeSeriesDataSet(Dataset):
 
         # fill in missing values (if not all time indices are specified
         sequence_length = len(time)
-        if sequence_length < index.sequence_length:
+        if sequence_length < self._index_sequence_length[idx]:
             assert self.allow_missing_timesteps, "allow_missing_timesteps should be True if sequences have gaps"
-            repetitions = torch.cat([time[1:] - time[:-1], torch.ones(1, dtype=time.dtype)])
-            indices = torch.repeat_interleave(torch.arange(len(time)), repetitions)
-            repetition_indices = torch.cat([torch.tensor([False], dtype=torch.bool), indices[1:] == indices[:-1]])
+            # each time step is repeated until the next available time step
+            repetitions = torch.cat([time[1:] - time[:-1], time.new_ones(1)])
+            indices = torch.repeat_interleave(repetitions)
+            # all but the first occurrence of a time step are filled in
+            repetition_indices = torch.ones(len(indices), dtype=torch.bool)
+            repetition_indices[repetitions.cumsum(0) - repetitions] = False
 
             # select data
             data_cat = data_cat[indices]
@@ -1508,25 +1670,19 @@ class TimeSeriesDataSet(Dataset):
                 weight = weight[indices]
 
             # reset index
-            if self.time_idx in self.reals:
-                time_idx = self.reals.index(self.time_idx)
+            if self.time_idx in self._reals_positions:
+                time_idx = self._reals_positions[self.time_idx]
                 data_cont[:, time_idx] = torch.linspace(
                     data_cont[0, time_idx], data_cont[-1, time_idx], len(target[0]), dtype=data_cont.dtype
                 )
 
             # make replacements to fill in categories
-            for name, value in self.encoded_constant_fill_strategy.items():
-                if name in self.reals:
-                    data_cont[repetition_indices, self.reals.index(name)] = value
-                elif name in [f"__target__{target_name}" for target_name in self.target_names]:
-                    target_pos = self.target_names.index(name[len("__target__") :])
-                    target[target_pos][repetition_indices] = value
-                elif name in self.flat_categoricals:
-                    data_cat[repetition_indices, self.flat_categoricals.index(name)] = value
-                elif name in self.target_names:  # target is just not an input value
-                    pass
-                else:
-                    raise KeyError(f"Variable {name} is not known and thus cannot be filled in")
+            fill_values = self._constant_fill_values
+            filled_rows = repetition_indices.nonzero()
+            data_cont[filled_rows, fill_values["reals"][0]] = fill_values["reals"][1]
+            data_cat[filled_rows, fill_values["categoricals"][0]] = fill_values["categoricals"][1]
+            for target_pos, value in fill_values["target"].items():
+                target[target_pos][repetition_indices] = value
 
             sequence_length = len(target[0])
 
@@ -1535,7 +1691,8 @@ class TimeSeriesDataSet(Dataset):
             sequence_length >= self.min_prediction_length
         ), "Sequence length should be at least minimum prediction length"
         # determine prediction/decode length and encode length
-        decoder_length = self.calculate_decoder_length(time[-1], sequence_length)
+        # pass python integers to take the scalar path instead of numpy reductions over 0-dim tensors
+        decoder_length = int(self.calculate_decoder_length(int(time[-1]), sequence_length))
         encoder_length = sequence_length - decoder_length
         assert (
             decoder_length >= self.min_prediction_length
@@ -1545,11 +1702,12 @@ class TimeSeriesDataSet(Dataset):
         if self.randomize_length is not None:  # randomization improves generalization
             # modify encode and decode lengths
             modifiable_encoder_length = encoder_length - self.min_encoder_length
-            encoder_length_probability = Beta(self.randomize_length[0], self.randomize_length[1]).sample()
+            # numpy is seeded per dataloader worker and avoids constructing a distribution object for every sample
+            encoder_length_probability = np.random.beta(self.randomize_length[0], self.randomize_length[1])
 
             # subsample a new/smaller encode length
             new_encoder_length = self.min_encoder_length + int(
-                (modifiable_encoder_length * encoder_length_probability).round()
+                round(float(modifiable_encoder_length * encoder_length_probability))
             )
 
             # extend decode length if possible
@@ -1565,20 +1723,18 @@ class TimeSeriesDataSet(Dataset):
 
             # switch some variables to nan if encode length is 0
             if encoder_length == 0 and len(self.dropout_categoricals) > 0:
-                data_cat[
-                    :, [self.flat_categoricals.index(c) for c in self.dropout_categoricals]
-                ] = 0  # zero is encoded nan
+                data_cat[:, self._dropout_categoricals_positions] = 0  # zero is encoded nan
 
         assert decoder_length > 0, "Decoder length should be greater than 0"
         assert encoder_length >= 0, "Encoder length should be at least 0"
 
         if self.add_relative_time_idx:
-            data_cont[:, self.reals.index("relative_time_idx")] = (
+            data_cont[:, self._reals_positions["relative_time_idx"]] = (
                 torch.arange(-encoder_length, decoder_length, dtype=data_cont.dtype) / self.max_encoder_length
             )
 
         if self.add_encoder_length:
-            data_cont[:, self.reals.index("encoder_length")] = (
+            data_cont[:, self._reals_positions["encoder_length"]] = (
                 (encoder_length - 0.5 * self.max_encoder_length) / self.max_encoder_length * 2.0
             )
 
@@ -1591,36 +1747,29 @@ class TimeSeriesDataSet(Dataset):
                 # get new scale
                 single_target_scale = target_normalizer.get_parameters()
                 # modify input data
-                if target_name in self.reals:
-                    data_cont[:, self.reals.index(target_name)] = target_normalizer.transform(target[idx])
+                if target_name in self._reals_positions:
+                    data_cont[:, self._reals_positions[target_name]] = target_normalizer.transform(target[idx])
                 if self.add_target_scales:
-                    data_cont[:, self.reals.index(f"{target_name}_center")] = self.transform_values(
+                    data_cont[:, self._reals_positions[f"{target_name}_center"]] = self.transform_values(
                         f"{target_name}_center", single_target_scale[0]
                     )[0]
-                    data_cont[:, self.reals.index(f"{target_name}_scale")] = self.transform_values(
+                    data_cont[:, self._reals_positions[f"{target_name}_scale"]] = self.transform_values(
                         f"{target_name}_scale", single_target_scale[1]
                     )[0]
                 # scale needs to be numpy to be consistent with GroupNormalizer
                 target_scale[idx] = single_target_scale.numpy()
 
         # rescale covariates
-        for name in self.reals:
-            if name not in self.target_names and name not in self.lagged_variables:
-                normalizer = self.get_transformer(name)
-                if isinstance(normalizer, EncoderNormalizer):
-                    # fit and transform
-                    pos = self.reals.index(name)
-                    normalizer.fit(data_cont[:encoder_length, pos])
-                    # transform
-                    data_cont[:, pos] = normalizer.transform(data_cont[:, pos])
+        covariate_normalizers, lagged_normalizers = self._encoder_normalized_reals
+        for pos, normalizer in covariate_normalizers:
+            # fit and transform
+            normalizer.fit(data_cont[:encoder_length, pos])
+            # transform
+            data_cont[:, pos] = normalizer.transform(data_cont[:, pos])
 
         # also normalize lagged variables
-        for name in self.reals:
-            if name in self.lagged_variables:
-                normalizer = self.get_transformer(name)
-                if isinstance(normalizer, EncoderNormalizer):
-                    pos = self.reals.index(name)
-                    data_cont[:, pos] = normalizer.transform(data_cont[:, pos])
+        for pos, normalizer in lagged_normalizers:
+            data_cont[:, pos] = normalizer.transform(data_cont[:, pos])
 
         # overwrite values
         if self._overwrite_values is not None:
@@ -1633,14 +1782,14 @@ class TimeSeriesDataSet(Dataset):
             else:  # decoder
                 positions = slice(encoder_length, None)
 
-            if self._overwrite_values["variable"] in self.reals:
-                idx = self.reals.index(self._overwrite_values["variable"])
+            if self._overwrite_values["variable"] in self._reals_positions:
+                idx = self._reals_positions[self._overwrite_values["variable"]]
                 data_cont[positions, idx] = self._overwrite_values["values"]
             else:
                 assert (
-                    self._overwrite_values["variable"] in self.flat_categoricals
+                    self._overwrite_values["variable"] in self._flat_categoricals_positions
                 ), "overwrite values variable has to be either in real or categorical variables"
-                idx = self.flat_categoricals.index(self._overwrite_values["variable"])
+                idx = self._flat_categoricals_positions[self._overwrite_values["variable"]]
                 data_cat[positions, idx] = self._overwrite_values["values"]
 
         # weight is only required for decoder
@@ -1663,7 +1812,7 @@ class TimeSeriesDataSet(Dataset):
                 encoder_length=encoder_length,
                 decoder_length=decoder_length,
                 encoder_target=encoder_target,
-                encoder_time_idx_start=time[0],
+                encoder_time_idx_start=time[0].clone(),
                 groups=groups,
                 target_scale=target_scale,
             ),
@@ -1696,20 +1845,31 @@ class TimeSeriesDataSet(Dataset):
         decoder_time_idx = decoder_time_idx_start.unsqueeze(1) + torch.arange(decoder_lengths.max()).unsqueeze(0)
         groups = torch.stack([batch[0]["groups"] for batch in batches])
 
-        # features
-        encoder_cont = rnn.pad_sequence(
-            [batch[0]["x_cont"][:length] for length, batch in zip(encoder_lengths, batches)], batch_first=True
-        )
-        encoder_cat = rnn.pad_sequence(
-            [batch[0]["x_cat"][:length] for length, batch in zip(encoder_lengths, batches)], batch_first=True
-        )
-
-        decoder_cont = rnn.pad_sequence(
-            [batch[0]["x_cont"][length:] for length, batch in zip(encoder_lengths, batches)], batch_first=True
-        )
-        decoder_cat = rnn.pad_sequence(
-            [batch[0]["x_cat"][length:] for length, batch in zip(encoder_lengths, batches)], batch_first=True
+        # features - concatenate all samples and scatter them into padded encoder and decoder tensors at once
+        sequence_lengths = torch.tensor([len(batch[0]["x_cont"]) for batch in batches], dtype=torch.long)
+        sample_idx = torch.repeat_interleave(torch.arange(len(batches)), sequence_lengths)
+        time_step = torch.arange(len(sample_idx)) - torch.repeat_interleave(
+            sequence_lengths.cumsum(0) - sequence_lengths, sequence_lengths
         )
+        sample_encoder_lengths = encoder_lengths[sample_idx]
+        is_encoder = time_step < sample_encoder_lengths
+        is_decoder = ~is_encoder
+        encoder_positions = (sample_idx[is_encoder], time_step[is_encoder])
+        decoder_positions = (sample_idx[is_decoder], time_step[is_decoder] - sample_encoder_lengths[is_decoder])
+        max_encoder_length = int(encoder_lengths.max())
+        max_decoder_length = int((sequence_lengths - encoder_lengths).max())
+
+        x_cont = torch.cat([batch[0]["x_cont"] for batch in batches])
+        encoder_cont = x_cont.new_zeros(len(batches), max_encoder_length, x_cont.size(1))
+        encoder_cont[encoder_positions] = x_cont[is_encoder]
+        decoder_cont = x_cont.new_zeros(len(batches), max_decoder_length, x_cont.size(1))
+        decoder_cont[decoder_positions] = x_cont[is_decoder]
+
+        x_cat = torch.cat([batch[0]["x_cat"] for batch in batches])
+        encoder_cat = x_cat.new_zeros(len(batches), max_encoder_length, x_cat.size(1))
+        encoder_cat[encoder_positions] = x_cat[is_encoder]
+        decoder_cat = x_cat.new_zeros(len(batches), max_decoder_length, x_cat.size(1))
+        decoder_cat[decoder_positions] = x_cat[is_decoder]
 
         # target scale
         if isinstance(batches[0][0]["target_scale"], torch.Tensor):  # stack tensor
@@ -1766,7 +1926,15 @@ class TimeSeriesDataSet(Dataset):
         )
 
     def to_dataloader(
-        self, train: bool = True, batch_size: int = 64, batch_sampler: Union[Sampler, str] = None, **kwargs
+        self,
+        train: bool = True,
+        batch_size: int = 64,
+        batch_sampler: Union[Sampler, str] = None,
+        num_workers: int = 0,
+        pin_memory: bool = None,
+        persistent_workers: bool = None,
+        prefetch_factor: int = 2,
+        **kwargs,
     ) -> DataLoader:
         """
         Get dataloader from dataset.
@@ -1785,6 +1953,14 @@ class TimeSeriesDataSet(Dataset):
                 * PyTorch Sampler instance: any PyTorch sampler, e.g. the WeightedRandomSampler()
                 * None: samples are taken randomly from times series.
 
+            num_workers (int): number of worker processes for data loading. Defaults to 0, i.e. loading in the main
+                process.
+            pin_memory (bool): if to copy batches into pinned memory for faster transfer to the GPU.
+                Defaults to None, i.e. ``True`` if CUDA is available.
+            persistent_workers (bool): if to keep worker processes alive between epochs instead of re-creating them.
+                Defaults to None, i.e. ``True`` if ``num_workers > 0``.
+            prefetch_factor (int): number of batches loaded in advance by each worker. Only used if
+                ``num_workers > 0``. Defaults to 2.
             **kwargs: additional arguments to ``DataLoader()``
 
         Returns:
@@ -1842,7 +2018,13 @@ class TimeSeriesDataSet(Dataset):
             collate_fn=self._collate_fn,
             batch_size=batch_size,
             batch_sampler=batch_sampler,
+            num_workers=num_workers,
+            pin_memory=torch.cuda.is_available() if pin_memory is None else pin_memory,
+            worker_init_fn=_worker_init_fn,
         )
+        if num_workers > 0:  # options are only valid for multi-process loading
+            default_kwargs["persistent_workers"] = True if persistent_workers is None else persistent_workers
+            default_kwargs["prefetch_factor"] = prefetch_factor
         default_kwargs.update(kwargs)
         kwargs = default_kwargs
         if kwargs["batch_sampler"] is not None:
@@ -1858,11 +2040,44 @@ class TimeSeriesDataSet(Dataset):
             del kwargs["shuffle"]
             del kwargs["drop_last"]
 
+        if kwargs["num_workers"] > 0:
+            # forked workers already share the memory pages of the parent process - only copy data into shared
+            # memory if workers are spawned
+            context = kwargs.get("multiprocessing_context")
+            if context is None:
+                start_method = (
+                    torch.multiprocessing.get_start_method(allow_none=True)
+                    or torch.multiprocessing.get_all_start_methods()[0]
+                )
+            elif isinstance(context, str):
+                start_method = context
+            else:
+                start_method = context.get_start_method()
+            if start_method != "fork":
+                self.share_memory()
+
         return DataLoader(
             self,
             **kwargs,
         )
 
+    def share_memory(self) -> "TimeSeriesDataSet":
+        """
+        Move tensorized data into shared memory.
+
+        Dataloader workers then access the same physical memory instead of receiving a copy of the data
+        (relevant if workers are spawned and not forked). Called automatically by :py:meth:`~to_dataloader` if
+        ``num_workers > 0`` and workers are not started with the ``"fork"`` method.
+
+        Returns:
+            TimeSeriesDataSet: self
+        """
+        for tensor in self.data.values():
+            for t in to_list(tensor):
+                if t is not None:
+                    t.share_memory_()
+        return self
+
     def x_to_index(self, x: Dict[str, torch.Tensor]) -> pd.DataFrame:
         """
         Decode dataframe index from x.
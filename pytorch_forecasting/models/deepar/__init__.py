@@ -143,6 +143,9 @@ class DeepAR(AutoRegressiveBaseModelWithCovariates):
             isinstance(target, (list, tuple)) and isinstance(loss, MultiLoss) and len(loss) == len(target)
         ), "number of targets should be equivalent to number of loss metrics"
 
+        # positions are looked up several times per forward pass - cache them in a buffer that follows the device
+        self.register_buffer("_target_positions", super().target_positions, persistent=False)
+
         rnn_class = get_rnn(cell_type)
         cont_size = len(self.reals)
         cat_size = sum(self.embeddings.output_size.values())
@@ -197,6 +200,16 @@ class DeepAR(AutoRegressiveBaseModelWithCovariates):
             dataset, allowed_encoder_known_variable_names=allowed_encoder_known_variable_names, **new_kwargs
         )
 
+    @property
+    def target_positions(self) -> torch.LongTensor:
+        """
+        Positions of target variable(s) in covariates.
+
+        Returns:
+            torch.LongTensor: tensor of positions.
+        """
+        return self._target_positions
+
     def construct_input_vector(
         self, x_cat: torch.Tensor, x_cont: torch.Tensor, one_off_target: torch.Tensor = None
     ) -> torch.Tensor:
@@ -206,18 +219,17 @@ class DeepAR(AutoRegressiveBaseModelWithCovariates):
         Args:
             one_off_target: tensor to insert into first position of target. If None (default), remove first time step.
         """
-        # create input vector
+        # create input vector - it is modified in place below, so it must not share memory with x_cont
         if len(self.categoricals) > 0:
             embeddings = self.embeddings(x_cat)
             flat_embeddings = torch.cat([emb for emb in embeddings.values()], dim=-1)
-            input_vector = flat_embeddings
-
-        if len(self.reals) > 0:
+            if len(self.reals) > 0:
+                input_vector = torch.cat([x_cont, flat_embeddings], dim=-1)
+            else:
+                input_vector = flat_embeddings
+        else:
             input_vector = x_cont.clone()
 
-        if len(self.reals) > 0 and len(self.categoricals) > 0:
-            input_vector = torch.cat([x_cont, flat_embeddings], dim=-1)
-
         # shift target by one
         input_vector[..., self.target_positions] = torch.roll(
             input_vector[..., self.target_positions], shifts=1, dims=1
@@ -95,7 +95,8 @@ class NHiTS(BaseModelWithCovariates):
                 than pooling_sizes but smaller equal prediction_length.
                 Defaults to a heuristic to match pooling_sizes.
             interpolation_mode (str, optional): Interpolation mode for forecasting. One of ['linear', 'nearest',
-                'cubic-x'] where 'x' is replaced by a batch size for the interpolation. Defaults to "linear".
+                'cubic', 'cubic-x'] where 'x' is replaced by a batch size to interpolate in chunks and limit
+                memory usage. Defaults to "linear".
             batch_normalization (bool, optional): Whether carry out batch normalization. Defaults to False.
             dropout (float, optional): dropout rate for hidden layers. Defaults to 0.0.
             activation (str, optional): activation function. One of ['ReLU', 'Softplus', 'Tanh', 'SELU',
@@ -267,10 +268,7 @@ class NHiTS(BaseModelWithCovariates):
         )
         backcast = encoder_y - backcast
 
-        # create block output: detach and split by block
-        block_backcasts = block_backcasts.detach()
-        block_forecasts = block_forecasts.detach()
-
+        # create block output: split by block (block outputs are already detached)
         if isinstance(self.hparams.output_size, (tuple, list)):
             forecast = forecast.split(self.hparams.output_size, dim=2)
             backcast = backcast.split(1, dim=2)
@@ -25,6 +25,11 @@ class IdentityBasis(nn.Module):
         self.forecast_size = forecast_size
         self.backcast_size = backcast_size
         self.interpolation_mode = interpolation_mode
+        # "cubic" interpolates all samples at once, "cubic-x" interpolates in chunks of x samples to limit memory
+        if "cubic" in interpolation_mode and interpolation_mode != "cubic":
+            self.cubic_batch_size = int(interpolation_mode.split("-")[-1])
+        else:
+            self.cubic_batch_size = None
 
     def forward(
         self,
@@ -47,16 +52,17 @@ class IdentityBasis(nn.Module):
                 knots, size=self.forecast_size, mode=self.interpolation_mode
             )  # , align_corners=True)
             forecast = forecast[:, 0, :]
-        elif "cubic" in self.interpolation_mode:
-            batch_size = int(self.interpolation_mode.split("-")[-1])
+        elif self.cubic_batch_size is None:
+            knots = knots[:, None, None, :]
+            forecast = F.interpolate(knots, size=self.forecast_size, mode="bicubic")[:, 0, 0, :]
+        else:
             knots = knots[:, None, None, :]
-            forecast = torch.zeros((len(knots), self.forecast_size)).to(knots.device)
-            n_batches = int(np.ceil(len(knots) / batch_size))
-            for i in range(n_batches):
-                forecast_i = F.interpolate(
-                    knots[i * batch_size : (i + 1) * batch_size], size=self.forecast_size, mode="bicubic"
-                )  # , align_corners=True)
-                forecast[i * batch_size : (i + 1) * batch_size] += forecast_i[:, 0, 0, :]
+            forecast = torch.cat(
+                [
+                    F.interpolate(knots_i, size=self.forecast_size, mode="bicubic")[:, 0, 0, :]
+                    for knots_i in knots.split(self.cubic_batch_size)
+                ]
+            )
 
         return backcast, forecast
 
@@ -165,13 +171,18 @@ class NHiTSBlock(nn.Module):
         self.basis = basis
 
     def forward(
-        self, encoder_y: torch.Tensor, encoder_x_t: torch.Tensor, decoder_x_t: torch.Tensor, x_s: torch.Tensor
+        self,
+        encoder_y: torch.Tensor,
+        encoder_x_t: torch.Tensor,
+        decoder_x_t: torch.Tensor,
+        x_s: torch.Tensor,
+        x_s_encoded: torch.Tensor = None,
     ) -> Tuple[torch.Tensor, torch.Tensor]:
         batch_size = len(encoder_y)
 
-        encoder_y = encoder_y.transpose(1, 2)
-        # Pooling layer to downsample input
+        # Pooling layer to downsample input (encoder_y is passed with shape batch_size x n_targets x time steps)
         encoder_y = self.pooling_layer(encoder_y)
+        # flatten time step-wise to keep the input layout of the first layer
         encoder_y = encoder_y.transpose(1, 2).reshape(batch_size, -1)
 
         if self.covariate_size > 0:
@@ -186,15 +197,17 @@ class NHiTSBlock(nn.Module):
 
         # Static exogenous
         if (self.static_size > 0) and (self.static_hidden_size > 0):
-            x_s = self.static_encoder(x_s)
-            encoder_y = torch.cat((encoder_y, x_s), 1)
+            if x_s_encoded is None:
+                x_s_encoded = self.static_encoder(x_s)
+            encoder_y = torch.cat((encoder_y, x_s_encoded), 1)
 
         # Compute local projection weights and projection
         theta = self.layers(encoder_y)
         backcast_theta = theta[:, : self.context_length * len(self.output_size)].reshape(-1, self.context_length)
         forecast_theta = theta[:, self.context_length * len(self.output_size) :].reshape(-1, self.n_theta)
         backcast, forecast = self.basis(backcast_theta, forecast_theta, encoder_x_t, decoder_x_t)
-        backcast = backcast.reshape(-1, len(self.output_size), self.context_length).transpose(1, 2)
+        # backcast is returned in the same layout as encoder_y, i.e. batch_size x n_targets x time steps
+        backcast = backcast.reshape(-1, len(self.output_size), self.context_length)
         forecast = forecast.reshape(-1, sum(self.output_size), self.prediction_length).transpose(1, 2)
 
         return backcast, forecast
@@ -332,41 +345,56 @@ class NHiTS(nn.Module):
         x_s,
     ):
 
+        # keep residuals as batch_size x n_targets x time steps so that blocks can pool them without transposing
         residuals = (
-            encoder_y  # .flip(dims=(1,))  # todo: check if flip is required or should be rather replaced by scatter
+            encoder_y.transpose(1, 2).contiguous()
+            # .flip(dims=(1,))  # todo: check if flip is required or should be rather replaced by scatter
         )
         # encoder_x_t = encoder_x_t.flip(dims=(-1,))
         # encoder_mask = encoder_mask.flip(dims=(-1,))
-        encoder_mask = encoder_mask.unsqueeze(-1)
+        encoder_mask = encoder_mask.unsqueeze(1)
 
-        level = encoder_y[:, -1:].repeat(1, self.prediction_length, 1)  # Level with Naive1
+        last_y = encoder_y[:, -1:]
+        # broadcast view is sufficient as the level is only read
+        level = last_y.expand(-1, self.prediction_length, -1)  # Level with Naive1
         forecast_level = level.repeat_interleave(torch.tensor(self.output_size, device=level.device), dim=2)
 
+        # block outputs are only used for interpretation and are therefore collected without gradients
+        # (n_batch, n_t, n_outputs, n_blocks)
+        n_block_outputs = len(self.blocks) + int(self.naive_level)
+        block_forecasts = forecast_level.new_empty(forecast_level.shape + (n_block_outputs,))
+        block_backcasts = encoder_y.new_empty(encoder_y.shape + (n_block_outputs,))
+
         # level with last available observation
         if self.naive_level:
-            block_forecasts = [forecast_level]
-            block_backcasts = [encoder_y[:, -1:].repeat(1, self.context_length, 1)]
+            block_forecasts[..., 0] = forecast_level.detach()
+            block_backcasts[..., 0] = last_y.detach()
 
-            forecast = block_forecasts[0]
+            forecast = forecast_level
         else:
-            block_forecasts = []
-            block_backcasts = []
             forecast = torch.zeros_like(forecast_level, device=forecast_level.device)
 
+        # outside of training, static encoders are deterministic (no dropout) and blocks with shared weights
+        # can reuse the encoded statics
+        reuse_statics = x_s is not None and not self.training
+        encoded_statics = {}
+
         # forecast by block
-        for block in self.blocks:
+        for idx, block in enumerate(self.blocks, start=int(self.naive_level)):
+            x_s_encoded = None
+            if reuse_statics and hasattr(block, "static_encoder"):
+                if block not in encoded_statics:
+                    encoded_statics[block] = block.static_encoder(x_s)
+                x_s_encoded = encoded_statics[block]
             block_backcast, block_forecast = block(
-                encoder_y=residuals, encoder_x_t=encoder_x_t, decoder_x_t=decoder_x_t, x_s=x_s
+                encoder_y=residuals, encoder_x_t=encoder_x_t, decoder_x_t=decoder_x_t, x_s=x_s, x_s_encoded=x_s_encoded
             )
             residuals = (residuals - block_backcast) * encoder_mask
 
             forecast = forecast + block_forecast
-            block_forecasts.append(block_forecast)
-            block_backcasts.append(block_backcast)
+            block_forecasts[..., idx] = block_forecast.detach()
+            block_backcasts[..., idx] = block_backcast.detach().transpose(1, 2)
 
-        # (n_batch, n_t, n_outputs, n_blocks)
-        block_forecasts = torch.stack(block_forecasts, dim=-1)
-        block_backcasts = torch.stack(block_backcasts, dim=-1)
-        backcast = residuals
+        backcast = residuals.transpose(1, 2)
 
         return forecast, backcast, block_forecasts, block_backcasts
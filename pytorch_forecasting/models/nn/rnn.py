@@ -102,8 +102,15 @@ class RNN(ABC, nn.RNNBase):
                 else:
                     out = torch.zeros(x.size(0), lengths.size(0), self.hidden_size, dtype=x.dtype, device=x.device)
                 return out, hidden_state
+            elif min_length == max_length:
+                # all sequences have the same length - no packing required which allows using the faster dense kernel
+                if self.batch_first:
+                    x = x[:, :max_length]
+                else:
+                    x = x[:max_length]
+                return super().forward(x, hx=hx)
             else:
-                pack_lengths = lengths.where(lengths > 0, torch.ones_like(lengths))
+                pack_lengths = lengths.clamp(min=1)
                 packed_out, hidden_state = super().forward(
                     rnn.pack_padded_sequence(
                         x, pack_lengths.cpu(), enforce_sorted=enforce_sorted, batch_first=self.batch_first
@@ -134,8 +141,8 @@ class LSTM(RNN, nn.LSTM):
         self, hidden_state: HiddenState, no_encoding: torch.BoolTensor, initial_hidden_state: HiddenState
     ) -> HiddenState:
         hidden, cell = hidden_state
-        hidden = hidden.masked_scatter(no_encoding, initial_hidden_state[0])
-        cell = cell.masked_scatter(no_encoding, initial_hidden_state[0])
+        hidden = torch.where(no_encoding, initial_hidden_state[0], hidden)
+        cell = torch.where(no_encoding, initial_hidden_state[1], cell)
         return hidden, cell
 
     def init_hidden_state(self, x: torch.Tensor) -> HiddenState:
@@ -169,7 +176,7 @@ class GRU(RNN, nn.GRU):
     def handle_no_encoding(
         self, hidden_state: HiddenState, no_encoding: torch.BoolTensor, initial_hidden_state: HiddenState
     ) -> HiddenState:
-        return hidden_state.masked_scatter(no_encoding, initial_hidden_state)
+        return torch.where(no_encoding, initial_hidden_state, hidden_state)
 
     def init_hidden_state(self, x: torch.Tensor) -> HiddenState:
         if self.batch_first:
@@ -51,6 +51,26 @@ def test_NaNLabelEncoder_add():
     assert encoder2.transform(np.array(["d"]))[0] == 3, "d must be encoded as 3"
 
 
+@pytest.mark.parametrize("add_nan", [True, False])
+def test_NaNLabelEncoder_categorical(add_nan):
+    encoder = NaNLabelEncoder(add_nan=add_nan, warn=False).fit(pd.Series(["b", "a", "c"]))
+    data = pd.Series(["c", "a", "b", "a"], dtype=pd.CategoricalDtype(["a", "b", "c", "d"]))
+    assert np.array_equal(encoder.transform(data), encoder.transform(data.to_numpy()))
+    unknown = pd.Series(["a", None, "d"], dtype=data.dtype)
+    if add_nan:
+        assert np.array_equal(encoder.transform(unknown), [encoder.classes_["a"], 0, 0])
+    else:
+        with pytest.raises(KeyError):
+            encoder.transform(unknown)
+
+
+def test_NaNLabelEncoder_mixed_types():
+    # integers in an object array are encoded next to the string "nan" class
+    encoder = NaNLabelEncoder(add_nan=True, warn=False).fit(np.array([1, 2], dtype=object))
+    encoded = encoder.transform(np.array([2, 3, "nan", 1], dtype=object))
+    assert np.array_equal(encoded, [encoder.classes_[2], 0, 0, encoder.classes_[1]])
+
+
 @pytest.mark.parametrize(
     "kwargs",
     [
@@ -118,7 +138,7 @@ def test_GroupNormalizer(kwargs, groups):
 
     test_data = dict(
         prediction=torch.tensor([encoded[0]]),
-        target_scale=torch.tensor(normalizer.get_parameters([1])).unsqueeze(0),
+        target_scale=torch.as_tensor(normalizer.get_parameters([1])).unsqueeze(0),
     )
 
     if kwargs.get("transformation") in ["relu", "softplus", "log1p", "log"]:
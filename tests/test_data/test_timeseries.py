@@ -5,7 +5,6 @@ from typing import Dict
 
 import networkx
 import numpy as np
-import pandas as pd
 import pytest
 from sklearn.preprocessing import StandardScaler
 import torch
@@ -27,6 +26,16 @@ def test_find_end_indices():
     np.testing.assert_array_equal(ends, ends_test)
     np.testing.assert_array_equal(missings, missings_test)
 
+    # several series with gaps whose maximum lengths are clipped at the end of each series
+    diffs = np.array([1, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1])
+    max_lengths = np.array([4, 4, 4, 4, 4, 4, 3, 1, 4, 4, 4, 3, 2, 1, 4, 3, 2, 1])
+
+    ends, missings = _find_end_indices(diffs, max_lengths, min_length=2)
+    ends_test = np.array([2, 3, 4, 6, 6, 7, 7, 7, 11, 12, 13, 13, 13, 13, 15, 17, 17, 17])
+    missings_test = np.array([[0, 1], [0, 2], [3, 5], [8, 9], [8, 10], [15, 16]])
+    np.testing.assert_array_equal(ends, ends_test)
+    np.testing.assert_array_equal(missings, missings_test)
+
 
 def test_raise_short_encoder_length(test_data):
     with pytest.warns(UserWarning):
@@ -43,6 +52,22 @@ def test_raise_short_encoder_length(test_data):
         )
 
 
+def test_raise_duplicate_time_steps_with_gap(test_data):
+    # a duplicate and a gap in the same series yield as many rows as time steps between first and last time index
+    series = test_data[lambda x: (x.agency == "Agency_22") & (x.sku == "SKU_01") & (x.time_idx < 3)].copy()
+    series["time_idx"] = [1, 1, 3]
+    with pytest.raises(AssertionError, match="unique"):
+        TimeSeriesDataSet(
+            series,
+            time_idx="time_idx",
+            target="volume",
+            group_ids=["agency", "sku"],
+            max_encoder_length=1,
+            max_prediction_length=1,
+            allow_missing_timesteps=True,
+        )
+
+
 def test_categorical_target(test_data):
     dataset = TimeSeriesDataSet(
         test_data,
@@ -63,6 +88,12 @@ def test_pickle(test_dataset):
     pickle.dumps(test_dataset.to_dataloader())
 
 
+def _one_batch(dataset: TimeSeriesDataSet, batch_size: int = 64):
+    """Collate a random batch from the dataset without going through a dataloader"""
+    indices = np.random.permutation(len(dataset))[:batch_size]
+    return dataset._collate_fn([dataset[idx] for idx in indices])
+
+
 def check_dataloader_output(dataset: TimeSeriesDataSet, out: Dict[str, torch.Tensor]):
     x, y = out
 
@@ -130,7 +161,6 @@ def check_dataloader_output(dataset: TimeSeriesDataSet, out: Dict[str, torch.Ten
         dict(predict_mode=True),
         dict(add_target_scales=True),
         dict(add_encoder_length=True),
-        dict(add_encoder_length=True),
         dict(add_relative_time_idx=True),
         dict(weight="volume"),
         dict(
@@ -165,12 +195,12 @@ def test_TimeSeriesDataSet(test_data, kwargs):
     # create dataset and sample from it
     dataset = TimeSeriesDataSet(test_data, **kwargs)
     repr(dataset)
-    check_dataloader_output(dataset, next(iter(dataset.to_dataloader(num_workers=0))))
+    check_dataloader_output(dataset, _one_batch(dataset))
 
 
 def test_from_dataset(test_dataset, test_data):
     dataset = TimeSeriesDataSet.from_dataset(test_dataset, test_data)
-    check_dataloader_output(dataset, next(iter(dataset.to_dataloader(num_workers=0))))
+    check_dataloader_output(dataset, _one_batch(dataset))
 
 
 def test_from_dataset_equivalence(test_data):
@@ -202,17 +232,32 @@ def test_from_dataset_equivalence(test_data):
             if isinstance(v1[0][k], (tuple, list)):
                 assert len(v1[0][k]) == len(v2[0][k])
                 for idx in range(len(v1[0][k])):
-                    assert torch.isclose(v1[0][k][idx], v2[0][k][idx]).all()
+                    torch.testing.assert_allclose(v1[0][k][idx], v2[0][k][idx])
             else:
-                assert torch.isclose(v1[0][k], v2[0][k]).all()
-        assert torch.isclose(v1[1][0], v2[1][0]).all()
+                torch.testing.assert_allclose(v1[0][k], v2[0][k])
+        torch.testing.assert_allclose(v1[1][0], v2[1][0])
+
+
+def test_to_dataloader_workers(test_dataset):
+    dataset = deepcopy(test_dataset)
+    expected = next(iter(dataset.to_dataloader(train=False, num_workers=0)))
+    dataloader = dataset.to_dataloader(train=False, num_workers=2)
+    assert dataloader.persistent_workers
+    x, y = next(iter(dataloader))
+    for name in ["encoder_cont", "encoder_cat", "decoder_cont", "decoder_cat", "encoder_lengths", "groups"]:
+        assert torch.equal(x[name], expected[0][name])
+    assert torch.equal(y[0], expected[1][0])
 
 
 def test_dataset_index(test_dataset):
-    index = []
-    for x, _ in iter(test_dataset.to_dataloader()):
-        index.append(test_dataset.x_to_index(x))
-    index = pd.concat(index, axis=0, ignore_index=True)
+    xs = [x for x, _ in iter(test_dataset.to_dataloader())]
+    # decode all batches at once - decoder time indices are padded per batch, so only their first step is kept
+    index = test_dataset.x_to_index(
+        dict(
+            decoder_time_idx=torch.cat([x["decoder_time_idx"][:, :1] for x in xs]),
+            groups=torch.cat([x["groups"] for x in xs]),
+        )
+    )
     assert len(index) <= len(test_dataset), "Index can only be subset of dataset"
 
 
@@ -237,37 +282,39 @@ def test_min_prediction_idx(test_dataset, test_data, min_prediction_idx):
     ],
 )
 def test_overwrite_values(test_dataset, value, variable, target):
-    dataset = deepcopy(test_dataset)
+    # the session-scoped dataset is not copied - overwrite values are reset in any case
+    dataset = test_dataset
 
     # create variables to check against
     control_outputs = next(iter(dataset.to_dataloader(num_workers=0, train=False)))
     dataset.set_overwrite_values(value, variable=variable, target=target)
+    try:
+        # test change
+        outputs = next(iter(dataset.to_dataloader(num_workers=0, train=False)))
+        check_dataloader_output(dataset, outputs)
 
-    # test change
-    outputs = next(iter(dataset.to_dataloader(num_workers=0, train=False)))
-    check_dataloader_output(dataset, outputs)
-
-    if variable in dataset.reals:
-        output_name_suffix = "cont"
-    else:
-        output_name_suffix = "cat"
-
-    if target == "all":
-        output_names = [f"encoder_{output_name_suffix}", f"decoder_{output_name_suffix}"]
-    else:
-        output_names = [f"{target}_{output_name_suffix}"]
+        if variable in dataset.reals:
+            output_name_suffix = "cont"
+        else:
+            output_name_suffix = "cat"
 
-    for name in outputs[0].keys():
-        changed = torch.isclose(outputs[0][name], control_outputs[0][name]).all()
-        if name in output_names or (
-            "cat" in name and variable == "agency"
-        ):  # exception for static categorical which should always change
-            assert not changed, f"Output {name} should change"
+        if target == "all":
+            output_names = [f"encoder_{output_name_suffix}", f"decoder_{output_name_suffix}"]
         else:
-            assert changed, f"Output {name} should not change"
+            output_names = [f"{target}_{output_name_suffix}"]
+
+        for name in outputs[0].keys():
+            changed = torch.isclose(outputs[0][name], control_outputs[0][name]).all()
+            if name in output_names or (
+                "cat" in name and variable == "agency"
+            ):  # exception for static categorical which should always change
+                assert not changed, f"Output {name} should change"
+            else:
+                assert changed, f"Output {name} should not change"
+    finally:
+        # test resetting
+        dataset.reset_overwrite_values()
 
-    # test resetting
-    dataset.reset_overwrite_values()
     outputs = next(iter(dataset.to_dataloader(num_workers=0, train=False)))
     for name in outputs[0].keys():
         changed = torch.isclose(outputs[0][name], control_outputs[0][name]).all()
@@ -301,7 +348,7 @@ def test_new_group_ids(test_data, kwargs):
     )
 
     # test sampling from training dataset
-    next(iter(train_dataset.to_dataloader()))
+    _one_batch(train_dataset)
 
     # create test dataset with group ids that have not been observed before
     test_dataset = TimeSeriesDataSet.from_dataset(train_dataset, test_data)
@@ -338,7 +385,7 @@ def test_encoder_normalizer_for_covariates(test_data):
         time_varying_known_reals=["price_regular"],
         scalers={"price_regular": EncoderNormalizer()},
     )
-    next(iter(dataset.to_dataloader()))
+    _one_batch(dataset)
 
 
 @pytest.mark.parametrize(
@@ -424,7 +471,7 @@ def test_lagged_variables(test_data, kwargs):
             lag_idx = vars.index(f"{name}_lagged_by_{lag}")
             target = x[..., target_idx][:, 0]
             lagged_target = torch.roll(x[..., lag_idx], -lag, dims=1)[:, 0]
-            assert torch.isclose(target, lagged_target).all(), "lagged target must be the same as non-lagged target"
+            torch.testing.assert_allclose(target, lagged_target, msg="lagged target must equal non-lagged target")
 
 
 @pytest.mark.parametrize(
@@ -447,6 +494,27 @@ def test_filter_data(test_dataset, agency, first_prediction_idx, should_raise):
             assert index["time_idx"].min() == first_prediction_idx, "First prediction filter has failed"
 
 
+def test_filter_data_inplace(test_dataset):
+    dataset = deepcopy(test_dataset)
+    dataset.filter(lambda x: x.agency == "Agency_01", copy=False)
+    assert len(dataset) < len(test_dataset), "filtered dataset should have less entries than original dataset"
+    for idx in range(len(dataset)):
+        x, _ = dataset[idx]
+        expected_group = dataset.data["groups"][dataset.index["index_start"].iloc[idx]]
+        assert torch.equal(x["groups"], expected_group), "Sample should be drawn from filtered index"
+
+
+def test_load_legacy_index(test_dataset):
+    state = dict(test_dataset.__dict__)
+    state["index"] = state.pop("_index")
+    for name in ["_index_start", "_index_end", "_index_sequence_length"]:
+        del state[name]
+    dataset = TimeSeriesDataSet.__new__(TimeSeriesDataSet)
+    dataset.__setstate__(state)
+    assert dataset.index is test_dataset.index
+    check_dataloader_output(dataset, _one_batch(dataset))
+
+
 def test_graph_sampler(test_dataset):
     from pytorch_forecasting.data.samplers import TimeSynchronizedBatchSampler
 
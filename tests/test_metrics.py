@@ -18,6 +18,35 @@ from pytorch_forecasting.metrics import (
 )
 from pytorch_forecasting.metrics.base_metrics import AggregationMetric, CompositeMetric
 
+CENTER_TRANSFORMATIONS = list(itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]))
+
+# parameters of the lognormal target distribution
+LOGNORMAL_LOC = 2.0
+LOGNORMAL_SCALE = 0.2
+
+
+# targets are sampled once per module and shared by all normalizer parametrizations - tests must not modify them
+@pytest.fixture(scope="module")
+def normal_target():
+    return NormalDistributionLoss.distribution_class(loc=1.0, scale=0.1).sample((100000,))
+
+
+@pytest.fixture(scope="module")
+def lognormal_target():
+    return LogNormalDistributionLoss.distribution_class(loc=LOGNORMAL_LOC, scale=LOGNORMAL_SCALE).sample((100000,))
+
+
+@pytest.fixture(scope="module")
+def negative_binomial_target():
+    return NegativeBinomialDistributionLoss().map_x_to_distribution(torch.tensor([100.0, 1.0])).sample((100000,))
+
+
+@pytest.fixture(scope="module")
+def multivariate_normal_target():
+    return MultivariateNormalDistributionLoss.distribution_class(
+        loc=torch.tensor([1.0, 1.0]), cov_diag=torch.tensor([0.2, 0.1]) ** 2, cov_factor=torch.tensor([[0.0], [0.0]])
+    ).sample((1000000,))
+
 
 def test_composite_metric():
     metric1 = SMAPE()
@@ -75,13 +104,10 @@ def test_none_reduction():
 
 @pytest.mark.parametrize(
     ["center", "transformation"],
-    itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]),
+    CENTER_TRANSFORMATIONS,
 )
-def test_NormalDistributionLoss(center, transformation):
-    mean = 1.0
-    std = 0.1
-    n = 100000
-    target = NormalDistributionLoss.distribution_class(loc=mean, scale=std).sample((n,))
+def test_NormalDistributionLoss(center, transformation, normal_target):
+    target = normal_target
     normalizer = TorchNormalizer(center=center, transformation=transformation)
     if transformation in ["log", "log1p", "relu", "softplus"]:
         target = target.abs()
@@ -104,13 +130,14 @@ def test_NormalDistributionLoss(center, transformation):
 
 @pytest.mark.parametrize(
     ["center", "transformation"],
-    itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]),
+    [
+        (center, transformation)
+        for center, transformation in CENTER_TRANSFORMATIONS
+        if transformation in ["log", "log1p"]
+    ],
 )
-def test_LogNormalDistributionLoss(center, transformation):
-    mean = 2.0
-    std = 0.2
-    n = 100000
-    target = LogNormalDistributionLoss.distribution_class(loc=mean, scale=std).sample((n,))
+def test_LogNormalDistributionLoss(center, transformation, lognormal_target):
+    target = lognormal_target
     normalizer = TorchNormalizer(center=center, transformation=transformation)
     normalized_target = normalizer.fit_transform(target).view(1, -1)
     target_scale = normalizer.get_parameters().unsqueeze(0)
@@ -121,82 +148,110 @@ def test_LogNormalDistributionLoss(center, transformation):
     )
     loss = LogNormalDistributionLoss()
 
-    if transformation not in ["log", "log1p"]:
-        with pytest.raises(AssertionError):
-            rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-    else:
-        rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-        samples = loss.sample(rescaled_parameters, 1)
-        assert torch.isclose(torch.as_tensor(mean), samples.log().mean(), atol=0.1, rtol=0.2)
-        if center:  # if not centered, softplus distorts std too much for testing
-            assert torch.isclose(torch.as_tensor(std), samples.log().std(), atol=0.1, rtol=0.7)
+    rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
+    samples = loss.sample(rescaled_parameters, 1)
+    assert torch.isclose(torch.as_tensor(LOGNORMAL_LOC), samples.log().mean(), atol=0.1, rtol=0.2)
+    if center:  # if not centered, softplus distorts std too much for testing
+        assert torch.isclose(torch.as_tensor(LOGNORMAL_SCALE), samples.log().std(), atol=0.1, rtol=0.7)
+
+
+def _check_incompatible_normalizer(loss, target: torch.Tensor, center: bool, transformation: str):
+    normalizer = TorchNormalizer(center=center, transformation=transformation)
+    normalized_target = normalizer.fit_transform(target).view(1, -1)
+    target_scale = normalizer.get_parameters().unsqueeze(0)
+    parameters = torch.stack([normalized_target, torch.ones_like(normalized_target)], dim=-1)
+    with pytest.raises(AssertionError):
+        loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
 
 
 @pytest.mark.parametrize(
     ["center", "transformation"],
-    itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]),
+    [
+        (center, transformation)
+        for center, transformation in CENTER_TRANSFORMATIONS
+        if transformation not in ["log", "log1p"]
+    ],
 )
-def test_NegativeBinomialDistributionLoss(center, transformation):
-    mean = 100.0
-    shape = 1.0
-    n = 100000
-    target = NegativeBinomialDistributionLoss().map_x_to_distribution(torch.tensor([mean, shape])).sample((n,))
+def test_LogNormalDistributionLoss_incompatible_normalizer(center, transformation):
+    # compatibility is checked before parameters are used - a small sample suffices
+    target = LogNormalDistributionLoss.distribution_class(loc=LOGNORMAL_LOC, scale=LOGNORMAL_SCALE).sample((100,))
+    _check_incompatible_normalizer(LogNormalDistributionLoss(), target, center, transformation)
+
+
+@pytest.mark.parametrize(
+    ["center", "transformation"],
+    [
+        (center, transformation)
+        for center, transformation in CENTER_TRANSFORMATIONS
+        if not center and transformation not in ["logit", "log"]
+    ],
+)
+def test_NegativeBinomialDistributionLoss(center, transformation, negative_binomial_target):
+    target = negative_binomial_target
     normalizer = TorchNormalizer(center=center, transformation=transformation)
     normalized_target = normalizer.fit_transform(target).view(1, -1)
     target_scale = normalizer.get_parameters().unsqueeze(0)
     parameters = torch.stack([normalized_target, 1.0 * torch.ones_like(normalized_target)], dim=-1)
     loss = NegativeBinomialDistributionLoss()
 
-    if center or transformation in ["logit", "log"]:
-        with pytest.raises(AssertionError):
-            rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-    else:
-        rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-        samples = loss.sample(rescaled_parameters, 1)
-        assert torch.isclose(target.mean(), samples.mean(), atol=0.1, rtol=0.5)
-        assert torch.isclose(target.std(), samples.std(), atol=0.1, rtol=0.5)
+    rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
+    samples = loss.sample(rescaled_parameters, 1)
+    assert torch.isclose(target.mean(), samples.mean(), atol=0.1, rtol=0.5)
+    assert torch.isclose(target.std(), samples.std(), atol=0.1, rtol=0.5)
 
 
 @pytest.mark.parametrize(
     ["center", "transformation"],
-    itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]),
+    [
+        (center, transformation)
+        for center, transformation in CENTER_TRANSFORMATIONS
+        if center or transformation in ["logit", "log"]
+    ],
 )
-def test_BetaDistributionLoss(center, transformation):
+def test_NegativeBinomialDistributionLoss_incompatible_normalizer(center, transformation):
+    target = NegativeBinomialDistributionLoss().map_x_to_distribution(torch.tensor([100.0, 1.0])).sample((100,))
+    _check_incompatible_normalizer(NegativeBinomialDistributionLoss(), target, center, transformation)
+
+
+def test_BetaDistributionLoss():
     initial_mean = 0.1
     initial_shape = 10
     n = 100000
     target = BetaDistributionLoss().map_x_to_distribution(torch.tensor([initial_mean, initial_shape])).sample((n,))
-    normalizer = TorchNormalizer(center=center, transformation=transformation)
+    normalizer = TorchNormalizer(center=True, transformation="logit")
     normalized_target = normalizer.fit_transform(target).view(1, -1)
     target_scale = normalizer.get_parameters().unsqueeze(0)
     parameters = torch.stack([normalized_target, 1.0 * torch.ones_like(normalized_target)], dim=-1)
     loss = BetaDistributionLoss()
 
-    if transformation not in ["logit"] or not center:
-        with pytest.raises(AssertionError):
-            loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-    else:
-        rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
-        samples = loss.sample(rescaled_parameters, 1)
-        assert torch.isclose(torch.as_tensor(initial_mean), samples.mean(), atol=0.01, rtol=0.01)  # mean=0.1
-        assert torch.isclose(target.std(), samples.std(), atol=0.02, rtol=0.3)  # std=0.09
+    rescaled_parameters = loss.rescale_parameters(parameters, target_scale=target_scale, encoder=normalizer)
+    samples = loss.sample(rescaled_parameters, 1)
+    assert torch.isclose(torch.as_tensor(initial_mean), samples.mean(), atol=0.01, rtol=0.01)  # mean=0.1
+    assert torch.isclose(target.std(), samples.std(), atol=0.02, rtol=0.3)  # std=0.09
 
 
 @pytest.mark.parametrize(
     ["center", "transformation"],
-    itertools.product([True, False], ["log", "log1p", "softplus", "relu", "logit", None]),
+    [
+        (center, transformation)
+        for center, transformation in CENTER_TRANSFORMATIONS
+        if transformation not in ["logit"] or not center
+    ],
 )
-def test_MultivariateNormalDistributionLoss(center, transformation):
-    normalizer = TorchNormalizer(center=center, transformation=transformation)
+def test_BetaDistributionLoss_incompatible_normalizer(center, transformation):
+    target = BetaDistributionLoss().map_x_to_distribution(torch.tensor([0.1, 10])).sample((100,))
+    _check_incompatible_normalizer(BetaDistributionLoss(), target, center, transformation)
 
-    mean = torch.tensor([1.0, 1.0])
-    std = torch.tensor([0.2, 0.1])
-    cov_factor = torch.tensor([[0.0], [0.0]])
-    n = 1000000
+
+@pytest.mark.parametrize(
+    ["center", "transformation"],
+    CENTER_TRANSFORMATIONS,
+)
+def test_MultivariateNormalDistributionLoss(center, transformation, multivariate_normal_target):
+    normalizer = TorchNormalizer(center=center, transformation=transformation)
 
     loss = MultivariateNormalDistributionLoss()
-    target = loss.distribution_class(loc=mean, cov_diag=std**2, cov_factor=cov_factor).sample((n,))
-    target = normalizer.inverse_preprocess(target)
+    target = normalizer.inverse_preprocess(multivariate_normal_target)
     target = target[:, 0]
     normalized_target = normalizer.fit_transform(target).view(1, -1)
     target_scale = normalizer.get_parameters().unsqueeze(0)
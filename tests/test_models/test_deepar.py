@@ -173,3 +173,9 @@ def test_pickle(dataloaders_with_covariates, loss):
     )
     pkl = pickle.dumps(model)
     pickle.loads(pkl)
+
+
+def test_target_positions(model):
+    assert model.target_positions.tolist() == [model.hparams.x_reals.index(model.hparams.target)]
+    # positions are not part of the checkpoint
+    assert "_target_positions" not in model.state_dict()
@@ -5,10 +5,12 @@ import pytest
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks import EarlyStopping
 from pytorch_lightning.loggers import TensorBoardLogger
+import torch
 
 from pytorch_forecasting.metrics import MQF2DistributionLoss, QuantileLoss
 from pytorch_forecasting.metrics.distributions import ImplicitQuantileNetworkDistributionLoss
 from pytorch_forecasting.models import NHiTS
+from pytorch_forecasting.models.nhits.sub_modules import IdentityBasis
 
 
 def _integration(dataloader, tmp_path, gpus, **kwargs):
@@ -131,3 +133,24 @@ def test_interpretation(model, dataloaders_with_covariates):
     raw_predictions, x = model.predict(dataloaders_with_covariates["val"], mode="raw", return_x=True, fast_dev_run=True)
     model.plot_prediction(x, raw_predictions, idx=0, add_loss_to_title=True)
     model.plot_interpretation(x, raw_predictions, idx=0)
+
+
+def test_block_outputs_detached(model, dataloaders_with_covariates):
+    x, _ = next(iter(dataloaders_with_covariates["train"]))
+    output = model(x)
+    assert output["prediction"].requires_grad
+    for block in output["block_forecasts"] + output["block_backcasts"]:
+        assert not block.requires_grad, "block outputs should be detached"
+
+
+def test_cubic_interpolation():
+    knots = torch.rand(10, 4)
+    backcast_theta = torch.rand(10, 6)
+    _, forecast = IdentityBasis(backcast_size=6, forecast_size=8, interpolation_mode="cubic")(
+        backcast_theta, knots, None, None
+    )
+    _, chunked_forecast = IdentityBasis(backcast_size=6, forecast_size=8, interpolation_mode="cubic-3")(
+        backcast_theta, knots, None, None
+    )
+    assert forecast.shape == (10, 8)
+    assert torch.allclose(forecast, chunked_forecast)
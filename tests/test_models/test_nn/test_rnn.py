@@ -49,3 +49,44 @@ def test_zero_length_sequence(klass, rnn_kwargs):
         assert (hidden_state[idx][:, lengths == 0] == 0).all() and (
             hidden_state[idx][:, lengths > 0] != 0
         ).all(), "Hidden state should be zero for zero-length sequences"
+
+
+@pytest.mark.parametrize("klass", [LSTM, GRU])
+def test_zero_length_sequence_initial_hidden_state(klass):
+    rnn = klass(input_size=2, hidden_size=5, batch_first=True)
+    x = torch.rand(4, 3, 2)
+    lengths = torch.tensor([2, 0, 3, 0])
+    init_hidden_state = rnn.init_hidden_state(x)
+    if isinstance(init_hidden_state, torch.Tensor):
+        init_hidden_state = torch.rand_like(init_hidden_state)
+    else:
+        init_hidden_state = tuple(torch.rand_like(h) for h in init_hidden_state)
+    _, hidden_state = rnn(x, init_hidden_state, lengths=lengths, enforce_sorted=False)
+
+    if isinstance(hidden_state, torch.Tensor):
+        hidden_state = [hidden_state]
+        init_hidden_state = [init_hidden_state]
+
+    for idx in range(len(hidden_state)):
+        assert torch.equal(
+            hidden_state[idx][:, lengths == 0], init_hidden_state[idx][:, lengths == 0]
+        ), "Initial hidden state should be propagated for zero-length sequences"
+
+
+@pytest.mark.parametrize("klass,batch_first", itertools.product([LSTM, GRU], [True, False]))
+def test_equal_length_sequences(klass, batch_first):
+    rnn = klass(input_size=2, hidden_size=5, batch_first=batch_first)
+    x = torch.rand(4, 5, 2)
+    lengths = torch.full(size=([5, 4][batch_first],), fill_value=3)
+    out, hidden_state = rnn(x, lengths=lengths, enforce_sorted=False)
+    expected_out, expected_hidden_state = rnn(
+        nn.utils.rnn.pack_padded_sequence(x, lengths, enforce_sorted=False, batch_first=batch_first)
+    )
+    expected_out, _ = nn.utils.rnn.pad_packed_sequence(expected_out, batch_first=batch_first)
+
+    assert torch.allclose(out, expected_out)
+    if isinstance(hidden_state, torch.Tensor):
+        hidden_state = [hidden_state]
+        expected_hidden_state = [expected_hidden_state]
+    for idx in range(len(hidden_state)):
+        assert torch.allclose(hidden_state[idx], expected_hidden_state[idx])